@@ -23,11 +23,11 @@ from torch.optim import Optimizer
 from pytorch_lightning import _logger as log
 from pytorch_lightning.accelerators.accelerator import Accelerator, ReduceOp
 from pytorch_lightning.core import LightningModule
-from pytorch_lightning.utilities import rank_zero_info, rank_zero_only, rank_zero_warn, TPU_AVAILABLE
+from pytorch_lightning.utilities import rank_zero_info, rank_zero_only, rank_zero_warn, XLA_AVAILABLE, XLADeviceUtils
 from pytorch_lightning.utilities.cloud_io import atomic_save
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
-if TPU_AVAILABLE:
+if XLA_AVAILABLE:
     import torch_xla
     import torch_xla.core.xla_model as xm
     import torch_xla.distributed.parallel_loader as xla_pl
@@ -55,7 +55,7 @@ class TPUAccelerator(Accelerator):
         rank_zero_info(f'training on {self.trainer.tpu_cores} TPU cores')
 
         # TODO: Move this check to Trainer __init__ or device parser
-        if not TPU_AVAILABLE:
+        if not XLADeviceUtils.tpu_device_exists():
             raise MisconfigurationException('PyTorch XLA not installed.')
 
         # see: https://discuss.pytorch.org/t/segfault-with-multiprocessing-queue/81292/2
@@ -179,7 +179,7 @@ class TPUAccelerator(Accelerator):
         See Also:
             - :func:`~pytorch_lightning.utilities.apply_func.move_data_to_device`
         """
-        if not TPU_AVAILABLE:
+        if not XLADeviceUtils.tpu_device_exists():
             raise MisconfigurationException(
                 'Requested to transfer batch to TPU but XLA is not available.'
                 ' Are you sure this machine has TPUs?'
@@ -26,7 +26,7 @@ import torch
 
 from pytorch_lightning import _logger as log
 from pytorch_lightning.callbacks.base import Callback
-from pytorch_lightning.utilities import rank_zero_warn, TPU_AVAILABLE
+from pytorch_lightning.utilities import rank_zero_warn, XLADeviceUtils
 
 torch_inf = torch.tensor(np.Inf)
 
@@ -180,7 +180,7 @@ class EarlyStopping(Callback):
         if not isinstance(current, torch.Tensor):
             current = torch.tensor(current, device=pl_module.device)
 
-        if trainer.use_tpu and TPU_AVAILABLE:
+        if trainer.use_tpu and XLADeviceUtils.tpu_device_exists():
             current = current.cpu()
 
         if self.monitor_op(current - self.min_delta, self.best_score):
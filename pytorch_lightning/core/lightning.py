@@ -14,16 +14,14 @@
 
 """nn.Module with additional great features."""
 
-import os
-import tempfile
 import collections
 import copy
 import inspect
 import re
-import types
 from abc import ABC
 from argparse import Namespace
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, Mapping
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 import torch
 from pytorch_lightning import _logger as log
@@ -32,7 +30,7 @@ from pytorch_lightning.core.hooks import CheckpointHooks, DataHooks, ModelHooks
 from pytorch_lightning.core.memory import ModelSummary
 from pytorch_lightning.core.saving import ALLOWED_CONFIG_TYPES, PRIMITIVE_TYPES, ModelIO
 from pytorch_lightning.core.step_result import Result
-from pytorch_lightning.utilities import rank_zero_warn, AMPType, TPU_AVAILABLE
+from pytorch_lightning.utilities import rank_zero_warn, AMPType, XLA_AVAILABLE, ZERO_GRAD_SET_TO_NONE_AVAILABLE
 from pytorch_lightning.utilities.device_dtype_mixin import DeviceDtypeModuleMixin
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.parsing import AttributeDict, collect_init_args, get_init_args
@@ -40,7 +38,7 @@ from torch import ScriptModule, Tensor
 from torch.nn import Module
 from torch.optim.optimizer import Optimizer
 
-if TPU_AVAILABLE:
+if XLA_AVAILABLE:
     import torch_xla.core.xla_model as xm
 
 
@@ -1122,6 +1120,9 @@ class LightningModule(
         .. tip:: In manual mode we still automatically accumulate grad over batches if
            Trainer(accumulate_grad_batches=x) is set.
 
+        .. note:: With PyTorch 1.7+, the gradients are set to ``None`` after the optimizer step
+           instead of being filled with zeros, if the optimizer's ``zero_grad`` accepts ``set_to_none``.
+
         Args:
             optimizer: Optimizer used to perform `.step()` call
 
@@ -1130,7 +1131,8 @@ class LightningModule(
                 However, one coud provide True and False based on its own scheduling.
                 c.f example 2 and 3
 
-            optimizer_closure: One could provide its own optimizer_closure. Set to None by default.
+            optimizer_closure: One could provide its own optimizer_closure, any callable is accepted.
+                Set to None by default.
 
             args: Any parameters provided to optimizer.step()
 
@@ -1222,17 +1224,19 @@ class LightningModule(
         # make sure we're using manual opt
         self._verify_is_manual_optimization('manual_optimizer_step')
 
-        should_make_optimizer_step = not self.trainer.train_loop.should_accumulate()
-        make_optimizer_step = make_optimizer_step if make_optimizer_step is not None else should_make_optimizer_step
+        if optimizer_closure is not None and not callable(optimizer_closure):
+            raise MisconfigurationException(
+                f"`optimizer_closure` should be a callable, got {type(optimizer_closure).__name__}")
+
+        # only look at the accumulation state when the user doesn't provide its own schedule
+        if make_optimizer_step is None:
+            make_optimizer_step = not self.trainer.train_loop.should_accumulate()
 
         if make_optimizer_step:
 
             # mock closure function as the user is responsible to call `manual_backward`
-            def do_nothing_optimizer_closure():
-                return
-
-            is_callable = isinstance(optimizer_closure, types.FunctionType)
-            optimizer_closure = optimizer_closure if is_callable else do_nothing_optimizer_closure
+            if optimizer_closure is None:
+                optimizer_closure = _do_nothing_optimizer_closure
 
             self.trainer.train_loop.optimizer_step(
                 optimizer,
@@ -1247,12 +1251,16 @@ class LightningModule(
             if self.trainer.amp_backend == AMPType.NATIVE:
                 self.trainer.scaler.update()
 
-            # perform zero grad
-            optimizer.zero_grad()
+            # perform zero grad, dropping the gradients instead of filling them with zeros
+            # saves a full write pass over the gradient memory
+            if ZERO_GRAD_SET_TO_NONE_AVAILABLE and _zero_grad_accepts_set_to_none(optimizer):
+                optimizer.zero_grad(set_to_none=True)
+            else:
+                optimizer.zero_grad()
 
         else:
             # make sure to call optimizer_closure when accumulating
-            if isinstance(optimizer_closure, types.FunctionType):
+            if optimizer_closure is not None:
                 optimizer_closure()
 
     def backward(self, loss: Tensor, optimizer: Optimizer, optimizer_idx: int, *args, **kwargs) -> None:
@@ -1385,7 +1393,9 @@ class LightningModule(
 
         """
         if on_tpu:
-            xm.optimizer_step(optimizer, optimizer_args={'closure': optimizer_closure, **kwargs})
+            # `kwargs` is a fresh dict owned by this call, reuse it as the step arguments
+            kwargs.setdefault('closure', optimizer_closure)
+            xm.optimizer_step(optimizer, optimizer_args=kwargs)
         elif self.trainer.amp_backend == AMPType.NATIVE:
             # native amp does not yet support closures.
             # TODO: pass the closure to the step ASAP
@@ -1396,6 +1406,9 @@ class LightningModule(
             # TODO: pass the closure to the step ASAP
             optimizer_closure()
             optimizer.step(*args, **kwargs)
+        elif optimizer_closure is _do_nothing_optimizer_closure and _optimizer_closure_is_optional(type(optimizer)):
+            # backward was already run in `manual_optimizer_step`, don't make the optimizer call an empty closure
+            optimizer.step(*args, **kwargs)
         else:
             optimizer.step(closure=optimizer_closure, *args, **kwargs)
 
@@ -1690,6 +1703,7 @@ class LightningModule(
             ...     def forward(self, x):
             ...         return torch.relu(self.l1(x.view(x.size(0), -1)))
 
+            >>> import os, tempfile
             >>> with tempfile.NamedTemporaryFile(suffix='.onnx', delete=False) as tmpfile:
             ...     model = SimpleModel()
             ...     input_sample = torch.randn((1, 64))
@@ -1756,6 +1770,7 @@ class LightningModule(
             ...     def forward(self, x):
             ...         return torch.relu(self.l1(x.view(x.size(0), -1)))
             ...
+            >>> import os
             >>> model = SimpleModel()
             >>> torch.jit.save(model.to_torchscript(), "model.pt")  # doctest: +SKIP
             >>> os.path.isfile("model.pt")  # doctest: +SKIP
@@ -1829,3 +1844,27 @@ class LightningModule(
             return "hparams"
 
         return None
+
+
+def _do_nothing_optimizer_closure():
+    return
+
+
+# weakly keyed, so optimizer classes created on the fly (e.g. by Horovod) can still be garbage collected
+_closure_is_optional_cache = WeakKeyDictionary()
+_zero_grad_accepts_set_to_none_cache = WeakKeyDictionary()
+
+
+def _optimizer_closure_is_optional(optimizer_cls: type) -> bool:
+    if optimizer_cls not in _closure_is_optional_cache:
+        closure = inspect.signature(optimizer_cls.step).parameters.get("closure")
+        _closure_is_optional_cache[optimizer_cls] = closure is None or closure.default is not inspect.Parameter.empty
+    return _closure_is_optional_cache[optimizer_cls]
+
+
+def _zero_grad_accepts_set_to_none(optimizer: Optimizer) -> bool:
+    # checked on the instance, as e.g. apex amp patches `zero_grad` on the optimizer itself
+    if optimizer not in _zero_grad_accepts_set_to_none_cache:
+        parameters = inspect.signature(optimizer.zero_grad).parameters
+        _zero_grad_accepts_set_to_none_cache[optimizer] = "set_to_none" in parameters
+    return _zero_grad_accepts_set_to_none_cache[optimizer]
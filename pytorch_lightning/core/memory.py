@@ -302,22 +302,20 @@ def _format_summary_table(total_parameters: int, trainable_parameters: int, *col
     header = [s.format(c[0], l) for c, l in zip(cols, col_widths)]
 
     # Summary = header + divider + Rest of table
-    summary = " | ".join(header) + "\n" + "-" * total_width
+    # collect the lines and join once, repeated concatenation is quadratic in the number of layers
+    divider = "-" * total_width
+    lines = [" | ".join(header), divider]
     for i in range(n_rows):
-        line = []
-        for c, l in zip(cols, col_widths):
-            line.append(s.format(str(c[1][i]), l))
-        summary += "\n" + " | ".join(line)
-    summary += "\n" + "-" * total_width
-
-    summary += "\n" + s.format(get_human_readable_count(trainable_parameters), 10)
-    summary += "Trainable params"
-    summary += "\n" + s.format(get_human_readable_count(total_parameters - trainable_parameters), 10)
-    summary += "Non-trainable params"
-    summary += "\n" + s.format(get_human_readable_count(total_parameters), 10)
-    summary += "Total params"
-
-    return summary
+        lines.append(" | ".join(s.format(str(c[1][i]), l) for c, l in zip(cols, col_widths)))
+    lines.append(divider)
+
+    lines.append(s.format(get_human_readable_count(trainable_parameters), 10) + "Trainable params")
+    lines.append(
+        s.format(get_human_readable_count(total_parameters - trainable_parameters), 10) + "Non-trainable params"
+    )
+    lines.append(s.format(get_human_readable_count(total_parameters), 10) + "Total params")
+
+    return "\n".join(lines)
 
 
 def get_memory_profile(mode: str) -> Union[Dict[str, int], Dict[int, int]]:
@@ -112,10 +112,32 @@ class PassThroughProfiler(BaseProfiler):
     def stop(self, action_name: str) -> None:
         pass
 
+    def profile(self, action_name: str) -> "_NullProfileContext":
+        # nothing is recorded, skip the generator based context manager of the base class
+        return _NullProfileContext(action_name)
+
+    def profile_iterable(self, iterable, action_name: str):
+        return iterable
+
     def summary(self) -> str:
         return ""
 
 
+class _NullProfileContext:
+    """A no-op context manager, equivalent to ``contextlib.nullcontext`` (not available in Python 3.6)."""
+
+    __slots__ = ("action_name",)
+
+    def __init__(self, action_name: str):
+        self.action_name = action_name
+
+    def __enter__(self) -> str:
+        return self.action_name
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
 class SimpleProfiler(BaseProfiler):
     """
     This profiler simply records the duration of actions (in seconds) and reports
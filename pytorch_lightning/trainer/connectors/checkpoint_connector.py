@@ -20,6 +20,7 @@ import torch
 import pytorch_lightning
 from pytorch_lightning import _logger as log
 from pytorch_lightning.core.lightning import LightningModule
+from pytorch_lightning.trainer.optimizers import _enable_foreach
 from pytorch_lightning.utilities import APEX_AVAILABLE, AMPType, OMEGACONF_AVAILABLE, rank_zero_warn
 from pytorch_lightning.utilities.cloud_io import atomic_save, get_filesystem
 from pytorch_lightning.utilities.cloud_io import load as pl_load
@@ -173,6 +174,8 @@ class CheckpointConnector:
         optimizer_states = checkpoint['optimizer_states']
         for optimizer, opt_state in zip(self.trainer.optimizers, optimizer_states):
             optimizer.load_state_dict(opt_state)
+            # the restored param groups replace the `foreach` opt-in done when the optimizers were created
+            _enable_foreach([optimizer])
 
             # move optimizer to GPU 1 weight at a time
             # avoids OOM
@@ -75,6 +75,7 @@ class TrainerOptimizersMixin(ABC):
                 ' * A list of the previously described dict format, with an optional "frequency" key (int)'
             )
         lr_schedulers = self.configure_schedulers(lr_schedulers, monitor=monitor)
+        _enable_foreach(optimizers)
 
         return optimizers, lr_schedulers, optimizer_frequencies
 
@@ -145,6 +146,21 @@ class TrainerOptimizersMixin(ABC):
                     scheduler.load_state_dict(state)
 
 
+def _enable_foreach(optimizers: List[Optimizer]) -> None:
+    """
+    Opts the param groups of optimizers supporting it (PyTorch 1.12+) into the multi-tensor ``foreach``
+    implementation when all their parameters are on GPU, batching the per-parameter updates into a few kernels.
+    Param groups where ``foreach`` was set explicitly are left untouched, pass ``foreach=False`` to opt out.
+    Empty, ``differentiable`` and ``fused`` param groups are skipped, as ``foreach`` does not support the latter two.
+    """
+    for optimizer in optimizers:
+        for group in optimizer.param_groups:
+            if group.get('foreach', False) is not None or group.get('differentiable') or group.get('fused'):
+                continue
+            if group['params'] and all(p.is_cuda for p in group['params']):
+                group['foreach'] = True
+
+
 class _MockOptimizer(Optimizer):
     """The `_MockOptimizer` will be used inplace of an optimizer in the event that `None`
     is returned from `configure_optimizers`.
@@ -166,7 +182,7 @@ class _MockOptimizer(Optimizer):
         if closure is not None:
             closure()
 
-    def zero_grad(self):
+    def zero_grad(self, set_to_none: bool = False):
         pass  # Do Nothing
 
     def __repr__(self):
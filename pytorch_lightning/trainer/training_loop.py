@@ -46,6 +46,8 @@ class TrainLoop:
         self.automatic_optimization = True
         self._curr_step_result = None
         self._cur_grad_norm_dict = None
+        self._accumulate_grad_batches = 1
+        self._accumulate_grad_batches_mask = 0
 
     def on_trainer_init(
         self, max_epochs, min_epochs, max_steps, min_steps, num_sanity_val_steps, automatic_optimization
@@ -250,6 +252,14 @@ class TrainLoop:
         self.trainer.call_hook("on_epoch_start")
         self.trainer.call_hook("on_train_epoch_start")
 
+        # the accumulation factor is fixed for the whole epoch once the schedulers ran,
+        # cache it to avoid walking the trainer attributes on every batch
+        accumulate_grad_batches = self.trainer.accumulate_grad_batches
+        self._accumulate_grad_batches = accumulate_grad_batches
+        # for powers of two, the accumulation boundary check reduces to a bit mask
+        is_power_of_two = accumulate_grad_batches & (accumulate_grad_batches - 1) == 0
+        self._accumulate_grad_batches_mask = accumulate_grad_batches - 1 if is_power_of_two else None
+
     def on_train_batch_end(self, epoch_output, epoch_end_outputs, batch, batch_idx, dataloader_idx):
         # hook
         self.trainer.call_hook('on_batch_end')
@@ -731,8 +741,16 @@ class TrainLoop:
 
     @contextmanager
     def block_ddp_sync_behaviour(self):
-        if isinstance(self.trainer.model, torch.nn.parallel.DistributedDataParallel):
-            yield self.trainer.model.no_sync()
+        """
+        Blocks the ddp gradient sync on backward while accumulating gradients,
+        so the allreduce only happens on the batch performing the optimizer step.
+
+        Not blocked in manual optimization, as the user may step the optimizer within the training step.
+        """
+        is_ddp = isinstance(self.trainer.model, torch.nn.parallel.DistributedDataParallel)
+        if is_ddp and self.automatic_optimization:
+            with self.trainer.model.no_sync():
+                yield
         else:
             yield
 
@@ -831,16 +849,17 @@ class TrainLoop:
             self.trainer.global_step += 1
 
     def _accumulated_batches_reached(self):
-        return (self.trainer.batch_idx + 1) % self.trainer.accumulate_grad_batches == 0
+        if self._accumulate_grad_batches_mask is not None:
+            return (self.trainer.batch_idx + 1) & self._accumulate_grad_batches_mask == 0
+        return (self.trainer.batch_idx + 1) % self._accumulate_grad_batches == 0
 
     def _num_training_batches_reached(self):
         return (self.trainer.batch_idx + 1) == self.trainer.num_training_batches
 
     def should_accumulate(self):
         # checks if backward or backward + optimizer step (via closure)
-        accumulation_done = self._accumulated_batches_reached()
-        is_final_batch = self._num_training_batches_reached()
-        return not (accumulation_done or is_final_batch)
+        # short-circuit: the final batch check is only needed while accumulating
+        return not (self._accumulated_batches_reached() or self._num_training_batches_reached())
 
     def should_check_val_fx(self, batch_idx, is_last_batch):
         # decide if we should run validation
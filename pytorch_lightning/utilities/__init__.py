@@ -14,6 +14,8 @@
 """General utilities"""
 import importlib
 import platform
+import sys
+from distutils.version import LooseVersion
 from enum import Enum
 
 import numpy
@@ -47,8 +49,9 @@ APEX_AVAILABLE = _module_available("apex.amp")
 NATIVE_AMP_AVAILABLE = _module_available("torch.cuda.amp") and hasattr(torch.cuda.amp, "autocast")
 OMEGACONF_AVAILABLE = _module_available("omegaconf")
 HYDRA_AVAILABLE = _module_available("hydra")
+# `Optimizer.zero_grad(set_to_none=True)` was added in PyTorch 1.7
+ZERO_GRAD_SET_TO_NONE_AVAILABLE = LooseVersion(torch.__version__) >= LooseVersion("1.7.0")
 
-TPU_AVAILABLE = XLADeviceUtils.tpu_device_exists()
 FAIRSCALE_AVAILABLE = platform.system() != 'Windows' and _module_available('fairscale.nn.data_parallel')
 
 FLOAT16_EPSILON = numpy.finfo(numpy.float16).eps
@@ -56,6 +59,16 @@ FLOAT32_EPSILON = numpy.finfo(numpy.float32).eps
 FLOAT64_EPSILON = numpy.finfo(numpy.float64).eps
 
 
+if sys.version_info >= (3, 7):
+    def __getattr__(name: str):
+        # probing for a TPU spawns a process when XLA is installed, only do it on first access (PEP 562)
+        if name == "TPU_AVAILABLE":
+            return XLADeviceUtils.tpu_device_exists()
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+else:
+    TPU_AVAILABLE = XLADeviceUtils.tpu_device_exists()
+
+
 class AMPType(Enum):
     APEX = 'apex'
     NATIVE = 'native'
@@ -11,13 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import sys
+from unittest import mock
+
 import pytest
 import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
 
 import tests.base.develop_pipelines as tpipes
 import tests.base.develop_utils as tutils
 from pytorch_lightning.callbacks import EarlyStopping
+from pytorch_lightning.overrides.data_parallel import LightningDistributedDataParallel
 from tests.base import EvalModelTemplate
+from tests.base.boring_model import BoringModel
 from pytorch_lightning.core import memory
 from pytorch_lightning.trainer import Trainer
 
@@ -83,3 +91,47 @@ def test_ddp_all_dataloaders_passed_to_fit(tmpdir):
     )
     result = trainer.fit(model, **fit_options)
     assert result == 1, "DDP doesn't work with dataloaders passed to fit()."
+
+
+@pytest.mark.parametrize("automatic_optimization, expected_no_sync", [(True, True), (False, False)])
+def test_block_ddp_sync_behaviour(automatic_optimization, expected_no_sync):
+    """
+    Tests that `block_ddp_sync_behaviour` enters `no_sync` only with automatic optimization
+    """
+    trainer = Trainer(automatic_optimization=automatic_optimization)
+    trainer.model = mock.MagicMock(spec=torch.nn.parallel.DistributedDataParallel)
+
+    with trainer.train_loop.block_ddp_sync_behaviour():
+        pass
+
+    assert trainer.model.no_sync.return_value.__enter__.called == expected_no_sync
+
+
+def _ddp_no_sync_test_fn(rank, worldsize):
+    os.environ["MASTER_ADDR"] = "localhost"
+    dist.init_process_group("gloo", rank=rank, world_size=worldsize)
+
+    trainer = Trainer()
+    trainer.model = LightningDistributedDataParallel(BoringModel())
+    batch = torch.randn(2, 32)
+
+    with mock.patch.object(trainer.model, "reducer") as reducer:
+        with trainer.train_loop.block_ddp_sync_behaviour():
+            trainer.model(batch, 0)
+        reducer.prepare_for_backward.assert_not_called()
+
+        trainer.model(batch, 0)
+        reducer.prepare_for_backward.assert_called_once_with([])
+
+
+@pytest.mark.skipif(not torch.distributed.is_available(), reason="test requires torch.distributed")
+@pytest.mark.skipif(sys.platform == "win32", reason="DDP not available on windows")
+def test_block_ddp_sync_behaviour_skips_allreduce():
+    """
+    Tests that the forward of `LightningDistributedDataParallel` only prepares the allreduce outside of `no_sync`
+    """
+    tutils.reset_seed()
+    tutils.set_random_master_port()
+
+    worldsize = 1
+    mp.spawn(_ddp_no_sync_test_fn, args=(worldsize,), nprocs=worldsize)
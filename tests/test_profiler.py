@@ -5,7 +5,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from pytorch_lightning.profiler import AdvancedProfiler, SimpleProfiler
+from pytorch_lightning.profiler import AdvancedProfiler, PassThroughProfiler, SimpleProfiler
 
 PROFILER_OVERHEAD_MAX_TOLERANCE = 0.0005
 
@@ -73,6 +73,18 @@ def test_simple_profiler_iterable_durations(simple_profiler, action, expected):
     )
 
 
+def test_passthrough_profiler():
+    """Ensure the default profiler does not wrap the profiled code."""
+    profiler = PassThroughProfiler()
+
+    with profiler.profile("a") as action_name:
+        assert action_name == "a"
+
+    iterable = [1, 2, 3]
+    assert profiler.profile_iterable(iterable, "b") is iterable
+    assert profiler.summary() == ""
+
+
 def test_simple_profiler_overhead(simple_profiler, n_iter=5):
     """Ensure that the profiler doesn't introduce too much overhead during training."""
     for _ in range(n_iter):
@@ -13,7 +13,9 @@
 # limitations under the License.
 import collections
 import os
+from functools import partial
 from unittest import mock
+from weakref import WeakKeyDictionary
 
 import pytest
 import torch
@@ -21,7 +23,9 @@ import torch.nn.functional as F
 from unittest.mock import patch, call, ANY
 
 from pytorch_lightning import Trainer, seed_everything
-from pytorch_lightning.utilities import APEX_AVAILABLE
+from pytorch_lightning.core.lightning import _do_nothing_optimizer_closure, _optimizer_closure_is_optional
+from pytorch_lightning.utilities import APEX_AVAILABLE, ZERO_GRAD_SET_TO_NONE_AVAILABLE
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.base.boring_model import BoringModel
 
 
@@ -357,6 +361,14 @@ def test_multiple_optimizers_manual_apex(tmpdir):
     assert trainer.dev_debugger.count_events('backward_call') == limit_train_batches * num_manual_backward_calls
 
 
+def assert_grad_was_reset(grad):
+    # `manual_optimizer_step` drops the gradients when `zero_grad(set_to_none=True)` is available
+    if ZERO_GRAD_SET_TO_NONE_AVAILABLE:
+        assert grad is None
+    else:
+        assert torch.all(grad == 0)
+
+
 class ManualOptimizationExtendedModel(BoringModel):
 
     count = 0
@@ -402,7 +414,7 @@ class ManualOptimizationExtendedModel(BoringModel):
             except Exception:
                 # almost no diff between before and after
                 assert torch.abs(torch.sum(self.weight_before) - torch.sum(after_before)).item() < 10e-6
-        assert torch.all(self.layer.weight.grad == 0)
+        assert_grad_was_reset(self.layer.weight.grad)
         self.count += 1
 
     def on_train_end(self):
@@ -520,12 +532,12 @@ def test_manual_optimization_and_accumulated_gradient(tmpdir):
             after_before = self.layer.weight.clone()
             if self.should_update and self.should_have_updated:
                 assert not torch.equal(self.weight_before, after_before), self.count
-                assert torch.all(self.layer.weight.grad == 0)
+                assert_grad_was_reset(self.layer.weight.grad)
             else:
                 assert torch.equal(self.weight_before, after_before)
                 if self.count > 1:
                     if self.count % 4 == 1:
-                        assert torch.all(self.layer.weight.grad == 0)
+                        assert_grad_was_reset(self.layer.weight.grad)
                     else:
                         assert torch.sum(self.layer.weight.grad) != 0
             self.count += 1
@@ -809,6 +821,96 @@ def test_manual_optimizer_step_with_optimizer_closure_and_extra_arguments(step_m
     step_mock.assert_has_calls(expected_calls)
 
 
+@patch("torch.optim.SGD.step", autospec=True)
+def test_manual_optimizer_step_without_optimizer_closure(step_mock, tmpdir):
+    """
+    Tests that `manual_optimizer_step` doesn't pass an empty closure to the optimizer
+    """
+    class TestModel(BoringModel):
+        def training_step(self, batch, batch_idx):
+            # manual
+            opt = self.optimizers()
+            loss = self.step(batch[0])
+            self.manual_backward(loss, opt)
+            self.manual_optimizer_step(opt, 1, something="new")
+
+        def configure_optimizers(self):
+            optimizer = torch.optim.SGD(self.layer.parameters(), lr=0.1)
+            return optimizer
+
+    model = TestModel()
+    model.val_dataloader = None
+    model.training_epoch_end = None
+
+    limit_train_batches = 2
+    trainer = Trainer(
+        automatic_optimization=False,
+        default_root_dir=tmpdir,
+        limit_train_batches=limit_train_batches,
+        limit_val_batches=0,
+        max_epochs=1,
+        weights_summary=None,
+    )
+
+    trainer.fit(model)
+    # autospec keeps the signature of `SGD.step`, on which the closure detection relies
+    expected_calls = [call(ANY, 1, something="new") for s in range(limit_train_batches)]
+    step_mock.assert_has_calls(expected_calls)
+
+
+@pytest.mark.parametrize("optimizer_cls, expected", [
+    (torch.optim.SGD, True),
+    (torch.optim.Adam, True),
+    (torch.optim.LBFGS, False),
+])
+def test_optimizer_closure_is_optional(optimizer_cls, expected):
+    """
+    Tests that the closure detection inspects the `step` signature of the optimizer class
+    """
+    with patch("pytorch_lightning.core.lightning._closure_is_optional_cache", WeakKeyDictionary()):
+        assert _optimizer_closure_is_optional(optimizer_cls) is expected
+
+
+def test_manual_optimizer_step_without_optimizer_closure_when_required(tmpdir):
+    """
+    Tests that `manual_optimizer_step` still passes a closure to optimizers requiring one
+    """
+    class ClosureRequiredSGD(torch.optim.SGD):
+        closures = []
+
+        def step(self, closure):
+            self.closures.append(closure)
+            return super().step(closure=closure)
+
+    class TestModel(BoringModel):
+        def training_step(self, batch, batch_idx):
+            # manual
+            opt = self.optimizers()
+            loss = self.step(batch[0])
+            self.manual_backward(loss, opt)
+            self.manual_optimizer_step(opt)
+
+        def configure_optimizers(self):
+            return ClosureRequiredSGD(self.layer.parameters(), lr=0.1)
+
+    model = TestModel()
+    model.val_dataloader = None
+    model.training_epoch_end = None
+
+    limit_train_batches = 2
+    trainer = Trainer(
+        automatic_optimization=False,
+        default_root_dir=tmpdir,
+        limit_train_batches=limit_train_batches,
+        limit_val_batches=0,
+        max_epochs=1,
+        weights_summary=None,
+    )
+
+    trainer.fit(model)
+    assert ClosureRequiredSGD.closures == [_do_nothing_optimizer_closure] * limit_train_batches
+
+
 @patch("torch.optim.Adam.step")
 @patch("torch.optim.SGD.step")
 def test_manual_optimizer_step_with_optimizer_closure_with_different_frequencies(mock_sgd_step, mock_adam_step, tmpdir):
@@ -892,3 +994,59 @@ def test_manual_optimizer_step_with_optimizer_closure_with_different_frequencies
 
     expected_calls = [call(closure=ANY, optim='adam') for s in range(2)]
     mock_adam_step.assert_has_calls(expected_calls)
+
+
+def test_manual_optimizer_step_with_callable_optimizer_closure(tmpdir):
+    """
+    Tests that `manual_optimizer_step` accepts any callable as optimizer_closure
+    """
+    class TestModel(BoringModel):
+        def training_step(self, batch, batch_idx):
+            # manual
+            opt = self.optimizers()
+            loss = self.step(batch[0])
+
+            weight_before = self.layer.weight.clone()
+
+            self.manual_optimizer_step(opt, optimizer_closure=partial(self.manual_backward, loss, opt))
+
+            weight_after = self.layer.weight.clone()
+            assert not torch.equal(weight_before, weight_after)
+
+    model = TestModel()
+    model.val_dataloader = None
+    model.training_epoch_end = None
+
+    trainer = Trainer(
+        automatic_optimization=False,
+        default_root_dir=tmpdir,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        max_epochs=1,
+        weights_summary=None,
+    )
+    trainer.fit(model)
+
+
+def test_manual_optimizer_step_with_non_callable_optimizer_closure(tmpdir):
+    """
+    Tests that `manual_optimizer_step` raises when optimizer_closure is not callable
+    """
+    class TestModel(BoringModel):
+        def training_step(self, batch, batch_idx):
+            self.manual_optimizer_step(self.optimizers(), optimizer_closure="not a closure")
+
+    model = TestModel()
+    model.val_dataloader = None
+    model.training_epoch_end = None
+
+    trainer = Trainer(
+        automatic_optimization=False,
+        default_root_dir=tmpdir,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        max_epochs=1,
+        weights_summary=None,
+    )
+    with pytest.raises(MisconfigurationException, match="`optimizer_closure` should be a callable"):
+        trainer.fit(model)
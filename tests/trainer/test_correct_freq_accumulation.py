@@ -14,9 +14,12 @@
 """
 Tests to ensure that the training loop works with a dict
 """
+import math
 import os
 from unittest import mock
 
+import pytest
+
 from pytorch_lightning import Trainer
 from tests.base.model_template import EvalModelTemplate
 
@@ -57,3 +60,24 @@ def test_training_step_scalar(tmpdir):
     assert trainer.dev_debugger.logged_metrics[3]['global_step'] == 2
     assert trainer.dev_debugger.logged_metrics[4]['global_step'] == 3
     assert trainer.dev_debugger.logged_metrics[5]['global_step'] == 3
+
+
+@pytest.mark.parametrize("accumulate_grad_batches", [1, 2, 3, 4, 5])
+def test_global_step_with_grad_accumulation(tmpdir, accumulate_grad_batches):
+    """
+    Tests that the global step progresses once per accumulated batches, whether the factor is a power of two or not
+    """
+    model = EvalModelTemplate()
+
+    limit_train_batches = 12
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        limit_train_batches=limit_train_batches,
+        limit_val_batches=0,
+        max_epochs=1,
+        accumulate_grad_batches=accumulate_grad_batches,
+        weights_summary=None,
+    )
+    trainer.fit(model)
+
+    assert trainer.global_step == math.ceil(limit_train_batches / accumulate_grad_batches)
@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
 import pytest
 import torch
 
@@ -457,3 +459,101 @@ def test_lr_scheduler_with_no_actual_scheduler_raises(tmpdir):
     trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
     with pytest.raises(MisconfigurationException, match='The lr scheduler dict must have the key "scheduler"'):
         trainer.fit(model)
+
+
+@pytest.mark.parametrize("foreach", [None, False])
+def test_foreach_left_untouched_on_cpu_or_when_set(tmpdir, foreach):
+    """
+    Test that `foreach` is only enabled for GPU parameters and never overrides an explicit value
+    """
+    model = EvalModelTemplate()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    optimizer.param_groups[0]['foreach'] = foreach
+    model.configure_optimizers = lambda: optimizer
+
+    trainer = Trainer(default_root_dir=tmpdir)
+    optimizers, _, _ = trainer.init_optimizers(model)
+    assert optimizers[0].param_groups[0]['foreach'] is foreach
+
+
+def test_foreach_left_untouched_for_empty_param_group(tmpdir):
+    """
+    Test that `foreach` is not enabled for param groups without parameters
+    """
+    model = EvalModelTemplate()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    optimizer.param_groups[0]['params'] = []
+    optimizer.param_groups[0]['foreach'] = None
+    model.configure_optimizers = lambda: optimizer
+
+    trainer = Trainer(default_root_dir=tmpdir)
+    optimizers, _, _ = trainer.init_optimizers(model)
+    assert optimizers[0].param_groups[0]['foreach'] is None
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires GPU machine")
+def test_foreach_enabled_on_gpu(tmpdir):
+    """
+    Test that `foreach` is enabled when it is supported but not set and the parameters are on GPU
+    """
+    model = EvalModelTemplate().cuda()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    optimizer.param_groups[0]['foreach'] = None
+    model.configure_optimizers = lambda: optimizer
+
+    trainer = Trainer(default_root_dir=tmpdir)
+    optimizers, _, _ = trainer.init_optimizers(model)
+    assert optimizers[0].param_groups[0]['foreach'] is True
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires GPU machine")
+@pytest.mark.parametrize("flag", ['differentiable', 'fused'])
+def test_foreach_left_untouched_on_gpu_when_unsupported(tmpdir, flag):
+    """
+    Test that `foreach` is not enabled for `differentiable` or `fused` param groups
+    """
+    model = EvalModelTemplate().cuda()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    optimizer.param_groups[0]['foreach'] = None
+    optimizer.param_groups[0][flag] = True
+    model.configure_optimizers = lambda: optimizer
+
+    trainer = Trainer(default_root_dir=tmpdir)
+    optimizers, _, _ = trainer.init_optimizers(model)
+    assert optimizers[0].param_groups[0]['foreach'] is None
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires GPU machine")
+def test_foreach_enabled_on_gpu_after_resume(tmpdir):
+    """
+    Test that `foreach` is enabled again when resuming on GPU from a checkpoint saved with `foreach=None`
+    """
+    class TestModel(EvalModelTemplate):
+
+        def configure_optimizers(self):
+            optimizer = torch.optim.SGD(self.parameters(), lr=0.1)
+            optimizer.param_groups[0]['foreach'] = None
+            return optimizer
+
+        def on_train_start(self):
+            self.foreach = self.trainer.optimizers[0].param_groups[0]['foreach']
+
+    model = TestModel()
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_train_batches=2, limit_val_batches=0)
+    trainer.fit(model)
+    assert model.foreach is None
+
+    ckpt_path = os.path.join(tmpdir, 'foreach.ckpt')
+    trainer.save_checkpoint(ckpt_path)
+
+    model = TestModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=2,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        gpus=1,
+        resume_from_checkpoint=ckpt_path,
+    )
+    trainer.fit(model)
+    assert model.foreach is True
@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
 import time
+from unittest import mock
 
 import pytest
 
@@ -44,6 +46,15 @@ def test_xla_device_is_a_tpu():
     return device_type == "TPU"
 
 
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="lazy module attributes require Python 3.7")
+def test_tpu_available_is_probed_on_access():
+    """Check that TPU_AVAILABLE is only resolved when accessed"""
+    with mock.patch.object(xla_utils.XLADeviceUtils, "tpu_device_exists", return_value=True) as tpu_device_exists:
+        from pytorch_lightning.utilities import TPU_AVAILABLE
+        assert TPU_AVAILABLE is True
+        tpu_device_exists.assert_called_once()
+
+
 def test_result_returns_within_10_seconds():
     """Check that pl_multi_process returns within 10 seconds"""
 